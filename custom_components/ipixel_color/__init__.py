@@ -1,15 +1,21 @@
 """The iPIXEL Color integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from functools import partial
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import DeviceInfo
 
 from .api import iPIXELAPI, iPIXELConnectionError, iPIXELTimeoutError
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .common import update_ipixel_display
+from .const import DOMAIN, CONF_ADDRESS, CONF_NAME, AUTO_UPDATE_COOLDOWN
+from .fonts import get_cached_fonts
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,9 +42,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         
         _LOGGER.info("Successfully connected to iPIXEL device %s", address)
         
-        # Get device info for sensors
-        await api.get_device_info()
-        
     except iPIXELTimeoutError as err:
         _LOGGER.error("Connection timeout to iPIXEL device %s: %s", address, err)
         raise ConfigEntryNotReady(f"Connection timeout: {err}") from err
@@ -47,13 +50,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Failed to connect to iPIXEL device %s: %s", address, err)
         raise ConfigEntryNotReady(f"Connection failed: {err}") from err
     
-    # Store API instance in hass.data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = api
-    entry.runtime_data = api
+    # Scan font directories once (blocking I/O) so every entity shares the list
+    fonts = await hass.async_add_executor_job(get_cached_fonts)
+
+    # Device info shared by all entities for grouping in device registry
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, address)},
+        name=name,
+        manufacturer="iPIXEL",
+        model="LED Matrix Display",
+        sw_version="1.0",
+    )
+
+    # Coalesce auto-updates from rapid setting changes into one display refresh
+    auto_update = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=AUTO_UPDATE_COOLDOWN,
+        immediate=False,
+        function=partial(update_ipixel_display, hass, name, api),
+    )
+
+    # Store API instance and shared data on the config entry
+    entry_data = {
+        "api": api,
+        "fonts": fonts,
+        "device_info": device_info,
+        "auto_update": auto_update,
+    }
+    entry.runtime_data = entry_data
     
-    # Set up platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Query device info while the platforms are set up; entities that need
+    # it join the in-flight query through api.get_device_info()
+    await asyncio.gather(
+        api.get_device_info(),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+    )
     
     return True
 
@@ -64,8 +96,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # Unload platforms
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        entry_data = entry.runtime_data
+        entry_data["auto_update"].async_cancel()
+
         # Disconnect from device
-        api: iPIXELAPI = hass.data[DOMAIN].pop(entry.entry_id)
+        api: iPIXELAPI = entry_data["api"]
         try:
             await api.disconnect()
             _LOGGER.debug("Disconnected from iPIXEL device")
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import partial
 from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -33,15 +34,34 @@ class iPIXELAPI:
             hass: Home Assistant instance
             address: Bluetooth MAC address
         """
+        self._hass = hass
         self._address = address
         self._bluetooth = BluetoothClient(hass, address)
         self._power_state = False
         self._device_info: dict[str, Any] | None = None
         self._device_response: bytes | None = None
+        self._info_task: asyncio.Task[dict[str, Any]] | None = None
+        self._connect_lock = asyncio.Lock()
         
     async def connect(self) -> bool:
         """Connect to the iPIXEL device."""
         return await self._bluetooth.connect(self._notification_handler)
+
+    async def ensure_connected(self) -> None:
+        """Connect to the device unless already connected.
+
+        Concurrent callers share a single connection attempt.
+
+        Raises:
+            iPIXELConnectionError: If connection fails
+        """
+        if self.is_connected:
+            return
+        async with self._connect_lock:
+            if self.is_connected:
+                return
+            _LOGGER.debug("Reconnecting to iPIXEL device %s", self._address)
+            await self.connect()
     
     async def disconnect(self) -> None:
         """Disconnect from the device."""
@@ -117,7 +137,7 @@ class iPIXELAPI:
 
         Args:
             style: Clock style (0-8)
-            date: Date in DD/MM/YYYY format (defaults to today)
+            date: Date in DD/MM/YY format (defaults to today)
             show_date: Whether to show the date
             format_24: Whether to use 24-hour format
 
@@ -154,42 +174,32 @@ class iPIXELAPI:
         """Query device information and store it."""
         if self._device_info is not None:
             return self._device_info
-            
+
+        # Concurrent callers share a single in-flight query; the task clears
+        # itself when done so a cancelled waiter can't orphan it
+        if self._info_task is None:
+            self._info_task = asyncio.create_task(self._fetch_device_info())
+            self._info_task.add_done_callback(self._clear_info_task)
+        return await asyncio.shield(self._info_task)
+
+    def _clear_info_task(self, task: asyncio.Task[dict[str, Any]]) -> None:
+        """Forget the finished device info query."""
+        if self._info_task is task:
+            self._info_task = None
+
+    async def _fetch_device_info(self) -> dict[str, Any]:
+        """Query device information from the device."""
         try:
             command = build_device_info_command()
-            
-            # Set up notification response
-            self._device_response = None
-            response_received = asyncio.Event()
-            
-            def response_handler(sender: Any, data: bytearray) -> None:
-                self._device_response = bytes(data)
-                response_received.set()
-            
-            # Enable notifications temporarily
-            await self._bluetooth._client.start_notify(
-                "0000fa03-0000-1000-8000-00805f9b34fb", response_handler
-            )
-            
-            try:
-                # Send command
-                await self._bluetooth._client.write_gatt_char(
-                    "0000fa02-0000-1000-8000-00805f9b34fb", command
-                )
-                
-                # Wait for response (5 second timeout)
-                await asyncio.wait_for(response_received.wait(), timeout=5.0)
-                
-                if self._device_response:
-                    self._device_info = parse_device_response(self._device_response)
-                else:
-                    raise Exception("No response received")
-                    
-            finally:
-                await self._bluetooth._client.stop_notify(
-                    "0000fa03-0000-1000-8000-00805f9b34fb"
-                )
-            
+
+            # Send command and wait for the response (5 second timeout)
+            self._device_response = await self._bluetooth.request(command, timeout=5.0)
+
+            if self._device_response:
+                self._device_info = parse_device_response(self._device_response)
+            else:
+                raise Exception("No response received")
+
             _LOGGER.info("Device info retrieved: %s", self._device_info)
             return self._device_info
             
@@ -222,13 +232,15 @@ class iPIXELAPI:
             bg_color: Background color in hex format (e.g., '000000')
         """
         try:
-            # Get device dimensions
-            device_info = await self.get_device_info()
+            # Get device dimensions (cached after the first query)
+            device_info = self._device_info or await self.get_device_info()
             width = device_info["width"]
             height = device_info["height"]
 
-            # Render text to PNG with color gradient
-            png_data = render_text_to_png(text, width, height, antialias, font_size, font, line_spacing, text_color, bg_color)
+            # Render text to PNG with color gradient (CPU bound, keep it off the event loop)
+            png_data = await self._hass.async_add_executor_job(
+                partial(render_text_to_png, text, width, height, antialias, font_size, font, line_spacing, text_color, bg_color)
+            )
 
             # Generate image commands using pypixelcolor
             commands = make_image_command(
@@ -290,8 +302,8 @@ class iPIXELAPI:
             True if text was sent successfully
         """
         try:
-            # Get device info for height
-            device_info = await self.get_device_info()
+            # Get device info for height (cached after the first query)
+            device_info = self._device_info or await self.get_device_info()
             device_height = device_info["height"]
 
             # Generate text commands using pypixelcolor
@@ -338,7 +350,8 @@ class iPIXELAPI:
 
     def _notification_handler(self, sender: Any, data: bytearray) -> None:
         """Handle notifications from the device."""
-        _LOGGER.debug("Notification from %s: %s", sender, data.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Notification from %s: %s", sender, data.hex())
     
     @property
     def is_connected(self) -> bool:
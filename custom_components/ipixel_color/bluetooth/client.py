@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 from typing import Any, Callable, TYPE_CHECKING
 
 from bleak.exc import BleakError
@@ -16,7 +17,13 @@ if TYPE_CHECKING:
 
 from homeassistant.components import bluetooth
 
-from ..const import WRITE_UUID, NOTIFY_UUID
+from ..const import (
+    WRITE_UUID,
+    NOTIFY_UUID,
+    RECONNECT_ATTEMPTS,
+    RECONNECT_DELAY,
+    RECONNECT_MAX_DELAY,
+)
 from ..exceptions import iPIXELConnectionError
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,6 +44,8 @@ class BluetoothClient:
         self._client: BleakClientWithServiceCache | None = None
         self._connected = False
         self._notification_handler: Callable | None = None
+        self._inflight: asyncio.Future[bytes] | None = None
+        self._command_lock = asyncio.Lock()
 
     def _disconnected_callback(self, client: BleakClientWithServiceCache) -> None:
         """Called when device disconnects."""
@@ -69,22 +78,14 @@ class BluetoothClient:
                     "Ensure the device is powered on and in range."
                 )
 
-            # Use establish_connection with service caching for reliable connection
-            # This handles retries, timeouts, and works with Bluetooth proxies
-            _LOGGER.debug("Establishing connection to %s using bleak-retry-connector", self._address)
-            self._client = await establish_connection(
-                BleakClientWithServiceCache,
-                ble_device,
-                ble_device.name or "iPIXEL Display",
-                disconnected_callback=self._disconnected_callback,
-                max_attempts=3,
-            )
+            self._client = await self._establish_connection(ble_device)
 
             self._connected = True
 
-            # Store and enable notifications
+            # Store the handler and keep notifications enabled for the
+            # lifetime of the connection; responses are routed by _dispatch
             self._notification_handler = notification_handler
-            await self._client.start_notify(NOTIFY_UUID, notification_handler)
+            await self._client.start_notify(NOTIFY_UUID, self._dispatch)
             _LOGGER.info("Successfully connected to iPIXEL device")
             return True
 
@@ -95,6 +96,47 @@ class BluetoothClient:
             _LOGGER.error("Unexpected error connecting to %s: %s", self._address, err)
             raise iPIXELConnectionError(f"Connection failed: {err}") from err
 
+    async def _establish_connection(self, ble_device: Any) -> BleakClientWithServiceCache:
+        """Establish a connection, backing off between failed attempts.
+
+        Retries use full-jitter exponential backoff so several devices (or
+        integrations) reconnecting at once don't hammer the adapter together.
+
+        Args:
+            ble_device: BLEDevice to connect to
+
+        Returns:
+            Connected client
+
+        Raises:
+            BleakError: If every attempt fails
+            asyncio.TimeoutError: If every attempt times out
+        """
+        for attempt in range(RECONNECT_ATTEMPTS):
+            try:
+                # Use establish_connection with service caching for reliable connection
+                # This handles timeouts and works with Bluetooth proxies; retries
+                # and backoff are owned by this loop, so it makes one attempt
+                _LOGGER.debug("Establishing connection to %s using bleak-retry-connector", self._address)
+                return await establish_connection(
+                    BleakClientWithServiceCache,
+                    ble_device,
+                    ble_device.name or "iPIXEL Display",
+                    disconnected_callback=self._disconnected_callback,
+                    max_attempts=1,
+                )
+            except (asyncio.TimeoutError, BleakError) as err:
+                if attempt + 1 >= RECONNECT_ATTEMPTS:
+                    raise
+                delay = random.uniform(
+                    0, min(RECONNECT_MAX_DELAY, RECONNECT_DELAY * 2 ** attempt)
+                )
+                _LOGGER.debug(
+                    "Connection attempt %d/%d to %s failed (%s), retrying in %.1fs",
+                    attempt + 1, RECONNECT_ATTEMPTS, self._address, err, delay
+                )
+                await asyncio.sleep(delay)
+
     async def disconnect(self) -> None:
         """Disconnect from the device."""
         if self._client and self._connected:
@@ -120,60 +162,77 @@ class BluetoothClient:
         Raises:
             iPIXELConnectionError: If not connected
         """
-        if not self._connected or not self._client:
-            raise iPIXELConnectionError("Device not connected")
-
         try:
-            # Set up temporary response capture
-            response_data = []
-            response_received = asyncio.Event()
+            response = await self.request(command)
+            if response is not None:
+                if _LOGGER.isEnabledFor(logging.INFO):
+                    _LOGGER.info("Command response received: %s", response.hex())
+            else:
+                _LOGGER.debug("No response received within 2 seconds")
+            return True
+        except BleakError as err:
+            _LOGGER.error("Failed to send command: %s", err)
+            return False
 
-            def response_handler(sender: Any, data: bytearray) -> None:
-                response_data.append(bytes(data))
-                response_received.set()
-                _LOGGER.info("Device response: %s", data.hex())
+    async def request(self, command: bytes, timeout: float = 2.0) -> bytes | None:
+        """Send command to the device and wait for its notification response.
 
-            # Stop existing notifications first to avoid "already enabled" error
-            try:
-                await self._client.stop_notify(NOTIFY_UUID)
-            except (KeyError, BleakError) as e:
-                # No callback was registered yet, which is fine
-                _LOGGER.debug("Could not stop notifications (not started): %s", e)
+        Args:
+            command: Command bytes to send
+            timeout: Seconds to wait for a response
 
-            # Enable notifications to capture response
-            await self._client.start_notify(NOTIFY_UUID, response_handler)
+        Returns:
+            Response bytes, or None if the device did not answer in time
 
-            try:
-                _LOGGER.debug("Sending command: %s", command.hex())
-                await self._client.write_gatt_char(WRITE_UUID, command)
+        Raises:
+            iPIXELConnectionError: If not connected
+            BleakError: If the write fails
+        """
+        if not self._connected or not self._client:
+            raise iPIXELConnectionError("Device not connected")
 
-                # Wait for response with short timeout
+        # Serialize requests so writes and their responses never interleave
+        async with self._command_lock:
+            self._inflight = asyncio.get_running_loop().create_future()
+            try:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Sending command: %s", command.hex())
+                await self._write(command)
                 try:
-                    await asyncio.wait_for(response_received.wait(), timeout=2.0)
-                    if response_data:
-                        _LOGGER.info("Command response received: %s", response_data[-1].hex())
-                    else:
-                        _LOGGER.debug("No response received within timeout")
+                    return await asyncio.wait_for(self._inflight, timeout=timeout)
                 except asyncio.TimeoutError:
-                    _LOGGER.debug("No response received within 2 seconds")
-
+                    return None
             finally:
-                # Restore the original notification handler
-                try:
-                    await self._client.stop_notify(NOTIFY_UUID)
-                except (KeyError, BleakError) as e:
-                    _LOGGER.debug("Could not stop notifications in cleanup: %s", e)
+                self._inflight = None
 
-                if self._notification_handler:
-                    try:
-                        await self._client.start_notify(NOTIFY_UUID, self._notification_handler)
-                    except BleakError as e:
-                        _LOGGER.warning("Could not restart original notification handler: %s", e)
+    def _dispatch(self, sender: Any, data: bytearray) -> None:
+        """Route a notification to the pending request and the notification handler."""
+        if self._inflight is not None and not self._inflight.done():
+            self._inflight.set_result(bytes(data))
+        if self._notification_handler:
+            self._notification_handler(sender, data)
 
-            return True
-        except BleakError as err:
-            _LOGGER.error("Failed to send command: %s", err)
-            return False
+    async def _write(self, command: bytes) -> None:
+        """Write a command to the device in MTU-sized chunks.
+
+        All but the last chunk are sent as write-without-response so the BLE
+        stack can queue them back-to-back instead of waiting for an
+        acknowledgement per PDU. The last chunk is written with response to
+        flush the burst and confirm the device received it.
+
+        Args:
+            command: Command bytes to send
+        """
+        chunk_size = max(self._client.mtu_size - 3, 20)
+        last_offset = (len(command) - 1) // chunk_size * chunk_size
+        # Slice through a memoryview so chunks don't copy the frame data
+        view = memoryview(command)
+        for offset in range(0, len(command), chunk_size):
+            await self._client.write_gatt_char(
+                WRITE_UUID,
+                view[offset:offset + chunk_size],
+                response=offset == last_offset,
+            )
 
     @property
     def is_connected(self) -> bool:
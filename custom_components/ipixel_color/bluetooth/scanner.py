@@ -1,12 +1,15 @@
 """Bluetooth device discovery for iPIXEL Color devices."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from homeassistant.components import bluetooth
+from homeassistant.core import callback
 
-from ..const import DEVICE_NAME_PREFIX
+from ..const import DEVICE_NAME_PREFIX, DISCOVERY_TIMEOUT, SERVICE_UUID
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -14,9 +17,31 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
-def discover_ipixel_devices_ha(hass: HomeAssistant, return_all: bool = False) -> list[dict[str, Any]]:
+@dataclass(frozen=True, slots=True)
+class DiscoveredDevice:
+    """Bluetooth device found during discovery."""
+
+    address: str
+    name: str
+    rssi: int
+    is_compatible: bool
+
+
+def _is_ipixel_device(service_info: bluetooth.BluetoothServiceInfoBleak) -> bool:
+    """Return True if an advertisement matches the manifest's iPIXEL matchers."""
+    name = service_info.name
+    if name and name.startswith(DEVICE_NAME_PREFIX):
+        return True
+    return SERVICE_UUID in service_info.service_uuids
+
+
+def discover_ipixel_devices_ha(hass: HomeAssistant, return_all: bool = False) -> list[DiscoveredDevice]:
     """Discover iPIXEL devices using Home Assistant's Bluetooth integration.
 
+    Only connectable advertisements are requested: the display is driven over
+    GATT, so a device seen solely by a passive (non-connectable) scanner could
+    not be set up anyway.
+
     Args:
         hass: Home Assistant instance
         return_all: If True, return all devices with compatibility indication
@@ -25,7 +50,7 @@ def discover_ipixel_devices_ha(hass: HomeAssistant, return_all: bool = False) ->
         List of discovered device information with is_compatible flag
     """
     _LOGGER.debug("Starting iPIXEL device discovery using HA bluetooth API, return_all=%s", return_all)
-    devices = []
+    devices: list[DiscoveredDevice] = []
 
     try:
         # Use Home Assistant's bluetooth API to get discovered devices
@@ -34,33 +59,102 @@ def discover_ipixel_devices_ha(hass: HomeAssistant, return_all: bool = False) ->
         _LOGGER.debug("HA bluetooth API returned %d service infos", len(service_infos))
 
         for service_info in service_infos:
-            device_name = service_info.name or f"Unknown_{service_info.address[-4:]}"
-            _LOGGER.debug("Checking device: %s (%s)", device_name, service_info.address)
-
-            # Check if device is compatible (starts with our prefix)
-            is_compatible = bool(service_info.name and service_info.name.startswith(DEVICE_NAME_PREFIX))
-
-            device_info = {
-                "address": service_info.address,
-                "name": device_name,
-                "rssi": service_info.rssi,
-                "is_compatible": is_compatible,
-            }
-
-            # Include device if it's compatible OR if we want all devices
-            if is_compatible or return_all:
-                devices.append(device_info)
-                if is_compatible:
-                    _LOGGER.info("Found compatible iPIXEL device: %s", device_info)
-                else:
-                    _LOGGER.debug("Found other device: %s", device_info)
-
-        _LOGGER.debug("Discovery completed, found %d total devices (%d compatible)",
-                     len(devices), sum(1 for d in devices if d.get('is_compatible', False)))
+            # Check if device is compatible (name prefix or service UUID);
+            # nothing is built for other advertisers unless all devices were
+            # requested
+            if _is_ipixel_device(service_info):
+                is_compatible = True
+            elif return_all:
+                is_compatible = False
+            else:
+                continue
+
+            device_info = DiscoveredDevice(
+                address=service_info.address,
+                name=service_info.name or f"Unknown_{service_info.address[-4:]}",
+                rssi=service_info.rssi,
+                is_compatible=is_compatible,
+            )
+            devices.append(device_info)
+
+            if is_compatible:
+                _LOGGER.info("Found compatible iPIXEL device: %s", device_info)
+            else:
+                _LOGGER.debug("Found other device: %s", device_info)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Discovery completed, found %d total devices (%d compatible)",
+                         len(devices), sum(1 for d in devices if d.is_compatible))
         return devices
 
     except Exception as err:
-        _LOGGER.error("Discovery failed: %s", err)
-        import traceback
-        _LOGGER.error("Traceback: %s", traceback.format_exc())
-        return []
\ No newline at end of file
+        _LOGGER.exception("Discovery failed: %s", err)
+        return []
+
+
+async def async_discover_ipixel_devices(
+    hass: HomeAssistant,
+    return_all: bool = False,
+    timeout: float = DISCOVERY_TIMEOUT,
+    min_devices: int = 1,
+) -> list[DiscoveredDevice]:
+    """Discover iPIXEL devices, waiting for advertisements if none are known yet.
+
+    Returns immediately when Home Assistant has already seen enough compatible
+    devices, or with return_all when it has seen any device at all, so a form
+    listing them is never held back. Otherwise waits until min_devices have
+    advertised or the timeout expires, whichever comes first.
+
+    Args:
+        hass: Home Assistant instance
+        return_all: If True, return all devices with compatibility indication
+        timeout: Maximum time in seconds to wait for advertisements
+        min_devices: Number of compatible devices to wait for
+
+    Returns:
+        List of discovered device information with is_compatible flag
+    """
+    devices = discover_ipixel_devices_ha(hass, return_all)
+    seen = {device.address for device in devices if device.is_compatible}
+    if len(seen) >= min_devices or (return_all and devices):
+        return devices
+
+    found = asyncio.Event()
+
+    @callback
+    def _async_device_detected(
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        seen.add(service_info.address)
+        if len(seen) >= min_devices:
+            found.set()
+
+    # Let the bluetooth integration do the filtering so only iPIXEL
+    # advertisements reach the callback; matchers mirror manifest.json
+    matchers = (
+        bluetooth.BluetoothCallbackMatcher(
+            local_name=f"{DEVICE_NAME_PREFIX}*", connectable=True
+        ),
+        bluetooth.BluetoothCallbackMatcher(
+            service_uuid=SERVICE_UUID, connectable=True
+        ),
+    )
+    unregisters = [
+        bluetooth.async_register_callback(
+            hass,
+            _async_device_detected,
+            matcher,
+            bluetooth.BluetoothScanningMode.PASSIVE,
+        )
+        for matcher in matchers
+    ]
+    try:
+        await asyncio.wait_for(found.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        _LOGGER.debug("No iPIXEL device advertised within %.0f seconds", timeout)
+    finally:
+        for unregister in unregisters:
+            unregister()
+
+    return discover_ipixel_devices_ha(hass, return_all)
@@ -8,10 +8,9 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 
 from .api import iPIXELAPI
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .const import CONF_ADDRESS, CONF_NAME
 from .common import update_ipixel_display
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,7 +25,7 @@ async def async_setup_entry(
     address = entry.data[CONF_ADDRESS]
     name = entry.data[CONF_NAME]
     
-    api = hass.data[DOMAIN][entry.entry_id]
+    api = entry.runtime_data["api"]
     
     async_add_entities([
         iPIXELUpdateButton(hass, api, entry, address, name),
@@ -58,13 +57,7 @@ class iPIXELUpdateButton(ButtonEntity):
         self._attr_entity_description = "Manually update display with current text and settings"
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_press(self) -> None:
         """Handle button press to update display."""
@@ -101,22 +94,14 @@ class iPIXELSyncTimeButton(ButtonEntity):
         self._attr_entity_description = "Sync current time to device clock"
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_press(self) -> None:
         """Handle button press to sync time."""
         _LOGGER.debug("Manual time sync triggered")
         try:
             # Connect if needed
-            if not self._api.is_connected:
-                _LOGGER.debug("Reconnecting to device for time sync")
-                await self._api.connect()
+            await self._api.ensure_connected()
 
             # Sync time
             success = await self._api.sync_time()
@@ -7,13 +7,11 @@ from typing import TYPE_CHECKING
 from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 if TYPE_CHECKING:
     from .api import iPIXELAPI
 
-from .const import DOMAIN
 from .common import get_entity_id_by_unique_id, rgb_to_hex
 
 _LOGGER = logging.getLogger(__name__)
@@ -92,13 +90,7 @@ class iPIXELColorBase(TextEntity, RestoreEntity):
         self._current_value = self._default_color
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -2,13 +2,32 @@
 from __future__ import annotations
 
 import logging
+import re
+from functools import lru_cache
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.template import Template
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import slugify
 from .const import MODE_TEXT_IMAGE, MODE_TEXT, MODE_CLOCK, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Default values for settings whose entity is missing or unavailable
+_SETTING_DEFAULTS = {
+    "font": "OpenSans-Light.ttf",
+    "font_size": None,
+    "line_spacing": 0,
+    "antialiasing": True,
+}
+
+# Literal escape sequences users type into the text entity
+_ESC = {'\\n': '\n', '\\t': '\t'}
+_ESC_RE = re.compile('|'.join(map(re.escape, _ESC)))
+
+# Opening delimiter of a Jinja2 statement, expression or comment
+_TEMPLATE_SIGIL = re.compile(r'\{[%{#]')
+
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """Convert RGB tuple to hex color string."""
@@ -62,17 +81,37 @@ def get_entity_id_by_unique_id(hass: HomeAssistant, address: str, entity_suffix:
     registry = er.async_get(hass)
     unique_id = f"{address}_{entity_suffix}"
 
+    # The registry indexes entities by (platform, integration, unique_id)
+    if platform:
+        return registry.async_get_entity_id(platform, DOMAIN, unique_id)
+
     # Look up entity by unique_id
     for entity_id, entry in registry.entities.items():
         if entry.unique_id == unique_id and entry.platform == DOMAIN:
-            # If platform specified, verify it matches
-            if platform and not entity_id.startswith(f"{platform}."):
-                continue
             return entity_id
 
     return None
 
 
+def process_escape_sequences(text: str) -> str:
+    """Replace literal \\n and \\t in text with newline and tab characters."""
+    if '\\' not in text:
+        return text
+    return _ESC_RE.sub(lambda m: _ESC[m.group()], text)
+
+
+@lru_cache(maxsize=64)
+def device_slug(device_name: str) -> str:
+    """Return the entity ID slug Home Assistant derives from a device name."""
+    return slugify(device_name)
+
+
+@lru_cache(maxsize=128)
+def _get_template(text: str, hass: HomeAssistant) -> Template:
+    """Return a Template for text, reusing it so Jinja compiles it only once."""
+    return Template(text, hass)
+
+
 async def resolve_template_variables(hass: HomeAssistant, text: str) -> str:
     """Resolve Home Assistant template variables in text.
     
@@ -88,13 +127,14 @@ async def resolve_template_variables(hass: HomeAssistant, text: str) -> str:
     Returns:
         Text with variables resolved
     """
-    if not text or not any(pattern in text for pattern in ['{%', '{{', '{#']):
+    if not text or not _TEMPLATE_SIGIL.search(text):
         return text
     
     try:
-        template = Template(text, hass)
-        result = template.async_render()
-        return str(result)
+        template = _get_template(text, hass)
+        if template.is_static:
+            return text
+        return template.async_render(parse_result=False)
     except Exception as e:
         _LOGGER.warning("Template error in '%s': %s", text, e)
         return text
@@ -114,7 +154,7 @@ async def update_ipixel_display(hass: HomeAssistant, device_name: str, api, text
     """
     try:
         # Get current mode
-        mode = await _get_entity_setting(hass, device_name, "select", "mode_select", str, api._address)
+        mode = _get_entity_setting(hass, device_name, "select", "mode_select", str, api._address)
         if not mode:
             mode = MODE_TEXT_IMAGE  # Default to textimage mode
 
@@ -159,10 +199,10 @@ async def _update_textimage_mode(hass: HomeAssistant, device_name: str, api, tex
             text = text_state.state
         
         # Get all current settings
-        font_name = await _get_entity_setting(hass, device_name, "select", "font_select", str, api._address)
-        font_size = await _get_entity_setting(hass, device_name, "number", "font_size", float, api._address)
-        line_spacing = await _get_entity_setting(hass, device_name, "number", "line_spacing", int, api._address)
-        antialias = await _get_entity_setting(hass, device_name, "switch", "antialiasing", bool, api._address)
+        font_name = _get_entity_setting(hass, device_name, "select", "font_select", str, api._address)
+        font_size = _get_entity_setting(hass, device_name, "number", "font_size", float, api._address)
+        line_spacing = _get_entity_setting(hass, device_name, "number", "line_spacing", int, api._address)
+        antialias = _get_entity_setting(hass, device_name, "switch", "antialiasing", bool, api._address)
 
         # Get color settings from light entities
         text_color = get_color_from_light_entity(hass, api._address, "text_color", default="ffffff")
@@ -172,13 +212,11 @@ async def _update_textimage_mode(hass: HomeAssistant, device_name: str, api, tex
         _LOGGER.debug("Background color: #%s", bg_color)
 
         # Connect if needed
-        if not api.is_connected:
-            _LOGGER.debug("Reconnecting to device for display update")
-            await api.connect()
+        await api.ensure_connected()
 
         # Resolve templates and process escape sequences
         template_resolved = await resolve_template_variables(hass, text)
-        processed_text = template_resolved.replace('\\n', '\n').replace('\\t', '\t')
+        processed_text = process_escape_sequences(template_resolved)
 
         # Send text to display with current settings
         success = await api.display_text(processed_text, antialias, font_size, font_name, line_spacing, text_color, bg_color)
@@ -210,22 +248,20 @@ async def _update_clock_mode(hass: HomeAssistant, device_name: str, api) -> bool
     """
     try:
         # Get clock settings from entities
-        clock_style = await _get_entity_setting(hass, device_name, "select", "clock_style_select", int, api._address)
+        clock_style = _get_entity_setting(hass, device_name, "select", "clock_style_select", int, api._address)
         if clock_style is None:
             clock_style = 1  # Default style
 
-        format_24 = await _get_entity_setting(hass, device_name, "switch", "clock_24h", bool, api._address)
+        format_24 = _get_entity_setting(hass, device_name, "switch", "clock_24h", bool, api._address)
         if format_24 is None:
             format_24 = True  # Default to 24h
 
-        show_date = await _get_entity_setting(hass, device_name, "switch", "clock_show_date", bool, api._address)
+        show_date = _get_entity_setting(hass, device_name, "switch", "clock_show_date", bool, api._address)
         if show_date is None:
             show_date = True  # Default to showing date
 
         # Connect if needed
-        if not api.is_connected:
-            _LOGGER.debug("Reconnecting to device for clock mode update")
-            await api.connect()
+        await api.ensure_connected()
 
         # Send clock mode command
         success = await api.set_clock_mode(
@@ -273,7 +309,7 @@ async def _update_text_mode(hass: HomeAssistant, device_name: str, api, text: st
         # Get pypixelcolor text settings (reusing existing entities where possible)
 
         # Reuse existing font selector - convert TTF filename to full path
-        font_name = await _get_entity_setting(hass, device_name, "select", "font_select", str, api._address)
+        font_name = _get_entity_setting(hass, device_name, "select", "font_select", str, api._address)
         if font_name and font_name.endswith(('.ttf', '.otf')):
             # Custom TTF/OTF font from fonts/ folder
             from pathlib import Path
@@ -304,28 +340,26 @@ async def _update_text_mode(hass: HomeAssistant, device_name: str, api, text: st
         _LOGGER.debug("Text mode - text color: #%s", color)
 
         # Animation - need new number entity
-        animation = await _get_entity_setting(hass, device_name, "number", "text_animation", int, api._address)
+        animation = _get_entity_setting(hass, device_name, "number", "text_animation", int, api._address)
         if animation is None:
             animation = 0  # Default to no animation
 
         # Speed - need new number entity
-        speed = await _get_entity_setting(hass, device_name, "number", "text_speed", int, api._address)
+        speed = _get_entity_setting(hass, device_name, "number", "text_speed", int, api._address)
         if speed is None:
             speed = 80  # Default speed
 
         # Rainbow mode - need new number entity
-        rainbow_mode = await _get_entity_setting(hass, device_name, "number", "text_rainbow", int, api._address)
+        rainbow_mode = _get_entity_setting(hass, device_name, "number", "text_rainbow", int, api._address)
         if rainbow_mode is None:
             rainbow_mode = 0  # Default to no rainbow
 
         # Connect if needed
-        if not api.is_connected:
-            _LOGGER.debug("Reconnecting to device for text mode update")
-            await api.connect()
+        await api.ensure_connected()
 
         # Resolve templates and process escape sequences
         template_resolved = await resolve_template_variables(hass, text)
-        processed_text = template_resolved.replace('\\n', '\n').replace('\\t', '\t')
+        processed_text = process_escape_sequences(template_resolved)
 
         # Send text using pypixelcolor
         success = await api.display_text_pypixelcolor(
@@ -351,7 +385,7 @@ async def _update_text_mode(hass: HomeAssistant, device_name: str, api, text: st
         return False
 
 
-async def _get_entity_setting(hass: HomeAssistant, device_name: str, platform: str, setting: str, value_type=str, address: str = None):
+def _get_entity_setting(hass: HomeAssistant, device_name: str, platform: str, setting: str, value_type=str, address: str = None):
     """Get setting from Home Assistant entity.
 
     Args:
@@ -373,7 +407,7 @@ async def _get_entity_setting(hass: HomeAssistant, device_name: str, platform: s
 
         # Fallback to manual construction if not found
         if not entity_id:
-            entity_id = f"{platform}.{device_name.lower().replace(' ', '_')}_{setting}"
+            entity_id = f"{platform}.{device_slug(device_name)}_{setting}"
 
         state = hass.states.get(entity_id)
         
@@ -399,13 +433,7 @@ async def _get_entity_setting(hass: HomeAssistant, device_name: str, platform: s
 
 def _get_default_value(setting: str, value_type):
     """Get default value for a setting."""
-    defaults = {
-        "font": "OpenSans-Light.ttf",
-        "font_size": None,
-        "line_spacing": 0,
-        "antialiasing": True
-    }
-    default = defaults.get(setting)
+    default = _SETTING_DEFAULTS.get(setting)
     
     if value_type == bool and default is None:
         return True
@@ -12,7 +12,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
 from .api import iPIXELAPI, iPIXELConnectionError, iPIXELTimeoutError
-from .bluetooth.scanner import discover_ipixel_devices_ha
+from .bluetooth.scanner import DiscoveredDevice, async_discover_ipixel_devices
 from .const import DOMAIN, CONF_ADDRESS
 
 _LOGGER = logging.getLogger(__name__)
@@ -63,7 +63,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self):
         """Initialize config flow."""
-        self._discovered_devices: dict[str, dict[str, Any]] = {}
+        self._discovered_devices: dict[str, DiscoveredDevice] = {}
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -81,16 +81,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Discover devices using HA's bluetooth API
         try:
             _LOGGER.debug("CONFIG_FLOW: Starting device discovery using HA bluetooth API")
-            discovered = discover_ipixel_devices_ha(self.hass, return_all=True)
+            discovered = await async_discover_ipixel_devices(self.hass, return_all=True)
             _LOGGER.debug("CONFIG_FLOW: Discovery returned %d devices", len(discovered))
             self._discovered_devices = {
-                device["address"]: device for device in discovered
+                device.address: device for device in discovered
             }
             _LOGGER.debug("CONFIG_FLOW: Stored %d devices in _discovered_devices", len(self._discovered_devices))
         except Exception as err:
-            _LOGGER.error("CONFIG_FLOW: Discovery failed: %s", err)
-            import traceback
-            _LOGGER.error("CONFIG_FLOW: Traceback: %s", traceback.format_exc())
+            _LOGGER.exception("CONFIG_FLOW: Discovery failed: %s", err)
             errors["base"] = "discovery_failed"
 
         if not self._discovered_devices and not errors:
@@ -102,23 +100,23 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         other_devices = []
         
         for address, device in self._discovered_devices.items():
-            if device.get("is_compatible", False):
+            if device.is_compatible:
                 compatible_devices.append((address, device))
             else:
                 other_devices.append((address, device))
         
         # Sort each group by name for consistent ordering
-        compatible_devices.sort(key=lambda x: x[1]['name'])
-        other_devices.sort(key=lambda x: x[1]['name'])
+        compatible_devices.sort(key=lambda x: x[1].name)
+        other_devices.sort(key=lambda x: x[1].name)
         
         device_options = {}
         # Add compatible devices first with stars
         for address, device in compatible_devices:
-            device_options[address] = f"⭐ {device['name']} ({address})"
+            device_options[address] = f"⭐ {device.name} ({address})"
         
         # Add other devices without stars
         for address, device in other_devices:
-            device_options[address] = f"{device['name']} ({address})"
+            device_options[address] = f"{device.name} ({address})"
         
         # Add manual entry option
         device_options["manual"] = "Manual entry"
@@ -154,8 +152,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             info = await validate_input(
                 self.hass, 
                 {
-                    CONF_ADDRESS: device_info["address"],
-                    CONF_NAME: device_info["name"]
+                    CONF_ADDRESS: device_info.address,
+                    CONF_NAME: device_info.name
                 }
             )
         except CannotConnect:
@@ -170,14 +168,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self._show_discovery_form()
 
         # Check if already configured
-        await self.async_set_unique_id(device_info["address"])
+        await self.async_set_unique_id(device_info.address)
         self._abort_if_unique_id_configured()
 
         return self.async_create_entry(
             title=info["title"],
             data={
-                CONF_ADDRESS: device_info["address"],
-                CONF_NAME: device_info["name"],
+                CONF_ADDRESS: device_info.address,
+                CONF_NAME: device_info.name,
             },
         )
 
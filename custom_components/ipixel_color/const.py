@@ -4,12 +4,14 @@ DOMAIN = "ipixel_color"
 DEFAULT_NAME = "iPIXEL Display"
 
 # Bluetooth UUIDs from protocol documentation
+SERVICE_UUID = "0000fa01-0000-1000-8000-00805f9b34fb"
 WRITE_UUID = "0000fa02-0000-1000-8000-00805f9b34fb"
 NOTIFY_UUID = "0000fa03-0000-1000-8000-00805f9b34fb"
 CCCD_UUID = "00002902-0000-1000-8000-00805f9b34fb"
 
 # Device discovery
 DEVICE_NAME_PREFIX = "LED_BLE_"
+DISCOVERY_TIMEOUT = 5  # seconds to wait for a device to advertise
 
 # Configuration keys
 CONF_ADDRESS = "address"
@@ -18,10 +20,14 @@ CONF_NAME = "name"
 # Update interval
 SCAN_INTERVAL = 30
 
+# Auto-update settings
+AUTO_UPDATE_COOLDOWN = 0.1  # seconds to coalesce rapid setting changes
+
 # Connection settings
 CONNECTION_TIMEOUT = 10
 RECONNECT_ATTEMPTS = 3
-RECONNECT_DELAY = 1  # seconds between retry attempts
+RECONNECT_DELAY = 1  # base delay in seconds for retry backoff
+RECONNECT_MAX_DELAY = 60  # upper bound in seconds for a single backoff delay
 
 # Display modes (based on pypixelcolor capabilities)
 MODE_TEXT_IMAGE = "textimage"
@@ -34,4 +40,7 @@ AVAILABLE_MODES = [
     MODE_CLOCK,
 ]
 
-DEFAULT_MODE = MODE_TEXT_IMAGE
\ No newline at end of file
+DEFAULT_MODE = MODE_TEXT_IMAGE
+
+# Clock styles supported by the device (0-8)
+CLOCK_STYLES = ("0", "1", "2", "3", "4", "5", "6", "7", "8")
\ No newline at end of file
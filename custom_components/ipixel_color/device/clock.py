@@ -1,6 +1,8 @@
 """Clock mode commands for iPIXEL Color devices using pypixelcolor."""
 from __future__ import annotations
 
+from datetime import date as dt_date
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -24,7 +26,7 @@ def make_clock_mode_command(
 
     Args:
         style: Clock style (0-8). Different visual styles for the clock display.
-        date: Date to display in DD/MM/YYYY format. Defaults to today's date.
+        date: Date to display in DD/MM/YY format. Defaults to today's date.
         show_date: Whether to show the date alongside the time.
         format_24: Whether to use 24-hour format (True) or 12-hour format (False).
 
@@ -38,6 +40,19 @@ def make_clock_mode_command(
     if set_clock_mode is None:
         raise ImportError("pypixelcolor library is not installed")
 
+    # Resolve today's date here so cached commands never carry a stale date;
+    # pypixelcolor only accepts two-digit years
+    if not date:
+        date = dt_date.today().strftime("%d/%m/%y")
+
+    return _build_clock_mode_command(style, date, show_date, format_24)
+
+
+@lru_cache(maxsize=64)
+def _build_clock_mode_command(
+    style: int, date: str, show_date: bool, format_24: bool
+) -> bytes:
+    """Build and cache the clock mode command bytes for one parameter set."""
     # Call pypixelcolor's set_clock_mode function
     # It returns a SendPlan object with windows containing the command data
     send_plan = set_clock_mode(
@@ -48,11 +63,10 @@ def make_clock_mode_command(
     )
 
     # Extract the command bytes from the first (and only) window
-    if send_plan.windows and len(list(send_plan.windows)) > 0:
-        first_window = next(iter(send_plan.windows))
-        return first_window.data
-    else:
+    first_window = next(iter(send_plan.windows or ()), None)
+    if first_window is None:
         raise ValueError("pypixelcolor returned empty SendPlan")
+    return bytes(first_window.data)
 
 
 def make_time_command(
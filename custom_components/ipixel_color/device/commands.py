@@ -1,6 +1,13 @@
 """Command building for iPIXEL Color devices."""
 from __future__ import annotations
 
+import struct
+
+
+# Power control commands: [5, 0, 7, 1, on_byte] where on_byte = 1 for on, 0 for off
+_POWER_ON_COMMAND = bytes([5, 0, 7, 1, 1])
+_POWER_OFF_COMMAND = bytes([5, 0, 7, 1, 0])
+
 
 def make_power_command(on: bool) -> bytes:
     """Build power control command.
@@ -8,8 +15,7 @@ def make_power_command(on: bool) -> bytes:
     Command format from protocol documentation:
     [5, 0, 7, 1, on_byte] where on_byte = 1 for on, 0 for off
     """
-    on_byte = 1 if on else 0
-    return bytes([5, 0, 7, 1, on_byte])
+    return _POWER_ON_COMMAND if on else _POWER_OFF_COMMAND
 
 
 def make_brightness_command(brightness: int) -> bytes:
@@ -33,12 +39,9 @@ def make_brightness_command(brightness: int) -> bytes:
 
 
 def make_command_payload(opcode: int, payload: bytes) -> bytes:
-    """Create command with header (following ipixel-ctrl/common.py format)."""
-    total_length = len(payload) + 4  # +4 for length and opcode
-    
-    command = bytearray()
-    command.extend(total_length.to_bytes(2, 'little'))  # Length (little-endian)
-    command.extend(opcode.to_bytes(2, 'little'))        # Opcode (little-endian)
-    command.extend(payload)                             # Payload data
-    
-    return bytes(command)
\ No newline at end of file
+    """Create command with header (following ipixel-ctrl/common.py format).
+
+    Header is the little-endian total length (+4 for length and opcode)
+    followed by the little-endian opcode.
+    """
+    return struct.pack(f"<HH{len(payload)}s", len(payload) + 4, opcode, payload)
@@ -45,8 +45,10 @@ def parse_device_response(response: bytes) -> dict[str, Any]:
     if pypixelcolor_parse_device_info is None:
         raise ImportError("pypixelcolor library is not installed")
 
-    _LOGGER.debug("Device response: %s", response.hex())
-    _LOGGER.info("Raw device response bytes: %s", [hex(b) for b in response])
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Device response: %s", response.hex())
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info("Raw device response bytes: %s", response.hex(" "))
 
     # Use pypixelcolor's parser to get DeviceInfo object
     device_info_obj = pypixelcolor_parse_device_info(response)
@@ -4,6 +4,8 @@ from __future__ import annotations
 import io
 import logging
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Tuple
 
@@ -16,7 +18,36 @@ _LOGGER = logging.getLogger(__name__)
 
 # Minimum font size to try
 MIN_FONT_SIZE = 4
-MARGIN_THRESHOLD = 64  # Pixel brightness threshold for margin detection
+
+
+# Drawing canvases reused across renders, keyed by (mode, width, height).
+# A canvas is only used while holding _canvas_lock since Home Assistant may
+# render for several devices concurrently.
+_canvases: dict[tuple[str, int, int], tuple[Image.Image, ImageDraw.ImageDraw]] = {}
+_canvas_lock = threading.Lock()
+
+
+def _get_canvas(mode: str, width: int, height: int) -> tuple[Image.Image, ImageDraw.ImageDraw]:
+    """Return a cleared drawing canvas, reusing a cached one if available.
+
+    Must be called with _canvas_lock held.
+
+    Args:
+        mode: PIL image mode
+        width: Canvas width in pixels
+        height: Canvas height in pixels
+
+    Returns:
+        Tuple of (image, draw) with the image cleared to black
+    """
+    key = (mode, width, height)
+    canvas = _canvases.get(key)
+    if canvas is None:
+        img = Image.new(mode, (width, height), 0)
+        canvas = _canvases[key] = (img, ImageDraw.Draw(img))
+    else:
+        canvas[1].rectangle((0, 0, width, height), fill=0)
+    return canvas
 
 
 def render_text_to_png(text: str, width: int, height: int, antialias: bool = True, font_size: float | None = None, font: str | None = None, line_spacing: int = 0, text_color: str = "ffffff", bg_color: str = "000000") -> bytes:
@@ -37,6 +68,8 @@ def render_text_to_png(text: str, width: int, height: int, antialias: bool = Tru
         PNG image data as bytes
 
     Note:
+        Blocking; must be called off the event loop.
+
         Uses linear interpolation to map grayscale values to colors:
         - 0 (black) → bg_color
         - 255 (white) → text_color
@@ -45,79 +78,60 @@ def render_text_to_png(text: str, width: int, height: int, antialias: bool = Tru
     # Create image with device dimensions
     # Use 'L' mode (grayscale) for non-antialiased to get sharper pixels
     image_mode = "RGB" if antialias else "1"
-    gray_mode = "L" if antialias else "1"
-    init_zero = (0,0,0) if antialias else 0
-    gray_zero = 0
 
     if font_size == 0:
         font_size = None
 
-    if not antialias:
-        img = Image.new(image_mode, (width, height), init_zero)  # 1-bit pixels, black background
-    else:
-        img = Image.new(image_mode, (width, height), init_zero)
-    draw = ImageDraw.Draw(img)
-    
-    # Process multiline text
-    lines = text.split('\n') if '\n' in text else [text]
-    
-    # Get font - either fixed size or auto-optimized
-    if font_size is not None:
-        font_obj = get_fixed_font(font_size, font)
-    else:
-        font_obj = get_optimal_font(draw, lines, width, height, font, line_spacing)
-    
-    # Create temporary image to measure actual content bounds
-    temp_img = Image.new(gray_mode, (width*2, height*2), gray_zero)  # Grayscale for easier analysis
-    temp_draw = ImageDraw.Draw(temp_img)
-    
-    # Draw all text to measure actual content area and calculate per-line bounds
-    temp_y = 0
-    line_data = []
-    for line in lines:
-        bbox = temp_draw.textbbox((0, 0), line, font=font_obj)
-        line_width = bbox[2] - bbox[0]
-        line_height = bbox[3] - bbox[1]
-        
-        # Draw line on temporary image
-        temp_draw.text((0, temp_y), line, font=font_obj, fill=255)
-
-        l_left, l_top, l_right, l_bottom = (bbox[0], bbox[1], bbox[2], bbox[3])
-        line_data.append({
-            'text': line,
-            'y_pos': temp_y,
-            'content_left': l_left,
-            'content_top': l_top,
-            'content_right': l_right,
-            'content_bottom': l_bottom,
-            'content_width': line_width,
-            'content_height': line_height
-        })
-        temp_y += line_height + line_spacing  # Add line spacing between lines
-
-    total_height = sum(data['content_height'] for data in line_data)
-    if len(lines) > 1:
-        total_height += line_spacing * (len(lines) - 1)
-    y_offset = (height - total_height) // 2
+    # Draw on a reused canvas; the lock is held until the grayscale copy
+    # is taken, after which the canvas is free for the next render
+    with _canvas_lock:
+        img, draw = _get_canvas(image_mode, width, height)
 
-    print(line_data)
-    # Draw each line with corrected positioning
-    current_y = y_offset
-    for i, (line, data) in enumerate(zip(lines, line_data)):
-        # Calculate horizontal position for this specific line using pre-calculated bounds
-        x = (width - data['content_width']) // 2 - data['content_left']
-        adjusted_y = current_y - data["content_top"]
+        # Process multiline text
+        lines = text.split('\n') if '\n' in text else [text]
 
-        
-        # Draw the line with appropriate fill color
-        if not antialias:
-            draw.text((x, adjusted_y), line, font=font_obj, fill=1)  # 1 for white in 1-bit mode
+        # Get font - either fixed size or auto-optimized
+        if font_size is not None:
+            font_obj = get_fixed_font(font_size, font)
         else:
-            draw.text((x, adjusted_y), line, font=font_obj, fill=(255, 255, 255))
-        
-        # Move to next line position
-        current_y += data['content_height'] + line_spacing  # Add line spacing between lines
-    
+            font_obj = get_optimal_font(draw, lines, width, height, font, line_spacing)
+
+        # Measure per-line bounds; layout only, nothing is rasterized here
+        line_data = []
+        for line in lines:
+            bbox = draw.textbbox((0, 0), line, font=font_obj)
+            line_data.append({
+                'content_left': bbox[0],
+                'content_top': bbox[1],
+                'content_width': bbox[2] - bbox[0],
+                'content_height': bbox[3] - bbox[1],
+            })
+
+        total_height = sum(data['content_height'] for data in line_data)
+        if len(lines) > 1:
+            total_height += line_spacing * (len(lines) - 1)
+        y_offset = (height - total_height) // 2
+
+        # Draw each line with corrected positioning
+        current_y = y_offset
+        for i, (line, data) in enumerate(zip(lines, line_data)):
+            # Calculate horizontal position for this specific line using pre-calculated bounds
+            x = (width - data['content_width']) // 2 - data['content_left']
+            adjusted_y = current_y - data["content_top"]
+
+            # Draw the line with appropriate fill color
+            if not antialias:
+                draw.text((x, adjusted_y), line, font=font_obj, fill=1)  # 1 for white in 1-bit mode
+            else:
+                draw.text((x, adjusted_y), line, font=font_obj, fill=(255, 255, 255))
+
+            # Move to next line position
+            current_y += data['content_height'] + line_spacing  # Add line spacing between lines
+
+        # Convert to grayscale for gradient mapping; 1-bit pixels map
+        # straight to 0/255
+        grayscale_img = img.convert('L')
+
     # Parse hex colors to RGB tuples using utility function
     try:
         bg_r, bg_g, bg_b = hex_to_rgb(bg_color)
@@ -127,103 +141,34 @@ def render_text_to_png(text: str, width: int, height: int, antialias: bool = Tru
         bg_r, bg_g, bg_b = 0, 0, 0
         text_r, text_g, text_b = 255, 255, 255
 
-    # Apply color gradient mapping using linear interpolation
-    # Convert grayscale image to RGB with gradient mapping
-    if not antialias:
-        # For 1-bit images, convert to grayscale first
-        grayscale_img = img.point(lambda x: 255 if x else 0).convert('L')
-    else:
-        # For RGB images, convert to grayscale
-        grayscale_img = img.convert('L')
-
-    # Create RGB image with interpolated colors
-    rgb_img = Image.new('RGB', (width, height))
-    pixels_gray = grayscale_img.load()
-    pixels_rgb = rgb_img.load()
+    # Apply color gradient mapping using linear interpolation.
+    # Build one lookup table per channel for the linear interpolation
+    # color = bg_color * (1-t) + text_color * t, where t = gray_value / 255.0,
+    # so PIL maps every pixel in C instead of a per-pixel Python loop
+    lut = []
+    for bg_c, text_c in ((bg_r, text_r), (bg_g, text_g), (bg_b, text_b)):
+        lut.extend(int(bg_c * (1 - v / 255.0) + text_c * (v / 255.0)) for v in range(256))
+    rgb_img = grayscale_img.convert('RGB').point(lut)
 
-    for y in range(height):
-        for x in range(width):
-            # Get grayscale value (0-255)
-            gray_value = pixels_gray[x, y]
-
-            # Linear interpolation: t = gray_value / 255.0
-            # color = bg_color * (1-t) + text_color * t
-            t = gray_value / 255.0
-
-            r = int(bg_r * (1 - t) + text_r * t)
-            g = int(bg_g * (1 - t) + text_g * t)
-            b = int(bg_b * (1 - t) + text_b * t)
-
-            pixels_rgb[x, y] = (r, g, b)
-
-    # Convert to PNG bytes
+    # Convert to PNG bytes. Use the fastest zlib level: text frames are flat
+    # enough that level 1 compresses nearly as well as the default, while
+    # store-only would inflate the payload on a ~1-2 KB/s BLE link
     png_buffer = io.BytesIO()
-    rgb_img.save(png_buffer, format='PNG')
+    rgb_img.save(png_buffer, format='PNG', compress_level=1)
     return png_buffer.getvalue()
 
 
-def _calculate_content_bounds(img: Image.Image) -> tuple[int, int, int, int] | None:
-    """Calculate actual content bounds by analyzing pixels.
-    
-    Args:
-        img: Grayscale image with text content
-        
-    Returns:
-        Tuple of (left, top, right, bottom) bounds or None if no content
-    """
-    width, height = img.size
-    pixels = img.load()
-    
-    # Find top boundary (first row with bright pixels)
-    top = None
-    for y in range(height):
-        for x in range(width):
-            if pixels[x, y] > MARGIN_THRESHOLD:
-                top = y
-                break
-        if top is not None:
-            break
-    
-    if top is None:
-        return None  # No content found
-    
-    # Find bottom boundary (last row with bright pixels)
-    bottom = None
-    for y in range(height - 1, -1, -1):
-        for x in range(width):
-            if pixels[x, y] > MARGIN_THRESHOLD:
-                bottom = y + 1  # +1 because we want inclusive bounds
-                break
-        if bottom is not None:
-            break
-    
-    # Find left boundary (first column with bright pixels)
-    left = None
-    for x in range(width):
-        for y in range(top, bottom):
-            if pixels[x, y] > MARGIN_THRESHOLD:
-                left = x
-                break
-        if left is not None:
-            break
-    
-    # Find right boundary (last column with bright pixels)
-    right = None
-    for x in range(width - 1, -1, -1):
-        for y in range(top, bottom):
-            if pixels[x, y] > MARGIN_THRESHOLD:
-                right = x + 1  # +1 because we want inclusive bounds
-                break
-        if right is not None:
-            break
-    
-    if left is None or right is None:
-        return None
-    
-    _LOGGER.debug("Content bounds: left=%d, top=%d, right=%d, bottom=%d (content: %dx%d)", 
-                 left, top, right, bottom, right - left, bottom - top)
-    
-    return left, top, right, bottom
+@lru_cache(maxsize=32)
+def _get_font_path(font_name: str) -> str | None:
+    """Resolve a font name to a file path, caching the filesystem search."""
+    font_path = get_font_path(font_name)
+    return str(font_path) if font_path else None
+
+
+@lru_cache(maxsize=64)
+def _load_truetype(font_path: str, size: float) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing the parsed face across renders."""
+    return ImageFont.truetype(font_path, size)
 
 
 def get_fixed_font(size: float, font_name: str | None = None) -> ImageFont.FreeTypeFont:
@@ -239,10 +184,10 @@ def get_fixed_font(size: float, font_name: str | None = None) -> ImageFont.FreeT
     try:
         # Try to load custom font from fonts/ folder first
         if font_name:
-            font_path = get_font_path(font_name)
+            font_path = _get_font_path(font_name)
             if font_path:
                 try:
-                    return ImageFont.truetype(str(font_path), size)
+                    return _load_truetype(font_path, size)
                 except Exception as e:
                     _LOGGER.warning("Could not load custom font %s: %s", font_name, e)
 
@@ -268,104 +213,31 @@ def get_optimal_font(draw: ImageDraw.Draw, lines: list[str],
     Returns:
         Optimal font for the text
     """
-    # Compute theoretical optimal size based on text proportions
-    # Start with a baseline font to measure proportions
-    baseline_size = 100.0
-    baseline_font = get_fixed_font(baseline_size, font_name)
-    
-    # Find the longest line to determine width constraint
-    longest_line = max(lines, key=len) if lines else ""
-    
-    # Measure baseline dimensions
-    bbox = draw.textbbox((0, 0), longest_line, font=baseline_font)
-    baseline_width = bbox[2] - bbox[0]
-    baseline_line_height = bbox[3] - bbox[1]
-    
-    # Calculate total height with line spacing
-    total_baseline_height = baseline_line_height * len(lines)
-    if len(lines) > 1:
-        total_baseline_height += line_spacing * (len(lines) - 1)
-    
-    # Calculate theoretical optimal size based on proportions
-    width_ratio = max_width / baseline_width if baseline_width > 0 else 1.0
-    height_ratio = max_height / total_baseline_height if total_baseline_height > 0 else 1.0
-    theoretical_size = baseline_size * min(width_ratio, height_ratio)
-    
-    # Clamp to reasonable range
-    theoretical_size = max(1.0, min(theoretical_size, min(max_height, max_width)))
-    
-    _LOGGER.debug("Theoretical optimal size: %.1f (width_ratio: %.2f, height_ratio: %.2f)",
-                 theoretical_size, width_ratio, height_ratio)
-    
-    # Try sizes around the theoretical optimal with fine increments
+    # Text extent grows monotonically with font size, so binary search the
+    # largest fitting size in 0.1 pixel steps between 1.0 and the display size
     best_font = None
     best_size = 0.0
-    
-    # Test 3 iterations with refinement
-    test_ranges = [
-        (theoretical_size * 0.7, theoretical_size * 1.3, 2.0),  # Coarse: ±30% with 2.0 step
-        (best_size - 2.0, best_size + 2.0, 0.5),                # Medium: ±2 with 0.5 step  
-        (best_size - 0.5, best_size + 0.5, 0.1),                # Fine: ±0.5 with 0.1 step
-    ]
-    
-    for iteration, (start, end, step) in enumerate(test_ranges):
-        if iteration > 0 and best_size == 0:
-            break  # Skip refinement if no valid size found
-            
-        current_start = max(1.0, start if iteration == 0 else start)
-        current_end = min(min(max_height, max_width), end if iteration == 0 else end)
-        
-        size = current_start
-        while size <= current_end:
-            try:
-                # Try to load font at this size
-                font = None
-                if font_name:
-                    font_path = get_font_path(font_name)
-                    if font_path:
-                        try:
-                            font = ImageFont.truetype(str(font_path), size)
-                        except Exception as e:
-                            _LOGGER.debug("Custom font %s failed at size %.1f: %s", font_name, size, e)
-                
-                # Use default font if custom font failed or not specified
-                if font is None:
-                    font = ImageFont.load_default()
-                
-                # Check if all lines fit within dimensions
-                fits = True
-                total_height = 0
-                
-                for line in lines:
-                    bbox = draw.textbbox((0, 0), line, font=font)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
-                    
-                    # Check if line fits horizontally
-                    if text_width > max_width:
-                        fits = False
-                        break
-                        
-                    total_height += text_height
-                
-                # Add line spacing to total height
-                if len(lines) > 1:
-                    total_height += line_spacing * (len(lines) - 1)
-                
-                # Check if all lines fit vertically
-                if total_height > max_height:
-                    fits = False
-                
-                if fits and size > best_size:
-                    best_size = size
-                    best_font = font
-                    _LOGGER.debug("Iteration %d: Found better size: %.1f (total height: %d/%d)", 
-                                iteration + 1, size, total_height, max_height)
-                    
-            except Exception as e:
-                _LOGGER.debug("Font size %.1f failed: %s", size, e)
-            
-            size += step
+    low = 10
+    high = int(min(max_height, max_width) * 10)
+
+    while low <= high:
+        mid = (low + high) // 2
+        size = mid / 10
+        try:
+            font, total_height = _measure_lines(draw, lines, size, font_name, max_width, line_spacing)
+        except Exception as e:
+            _LOGGER.debug("Font size %.1f failed: %s", size, e)
+            high = mid - 1
+            continue
+
+        if total_height is not None and total_height <= max_height:
+            best_size = size
+            best_font = font
+            _LOGGER.debug("Found fitting size: %.1f (total height: %d/%d)",
+                        size, total_height, max_height)
+            low = mid + 1
+        else:
+            high = mid - 1
     
     # Return best font found
     if best_font:
@@ -374,4 +246,50 @@ def get_optimal_font(draw: ImageDraw.Draw, lines: list[str],
     
     # Fallback to minimum font size
     _LOGGER.warning("Using fallback font - text may not fit optimally")
-    return get_fixed_font(1.0, font_name)
\ No newline at end of file
+    return get_fixed_font(1.0, font_name)
+
+
+def _measure_lines(draw: ImageDraw.Draw, lines: list[str], size: float, font_name: str | None,
+                   max_width: int, line_spacing: int) -> tuple[ImageFont.FreeTypeFont, int | None]:
+    """Load a font at the given size and measure the total height of all lines.
+
+    Args:
+        draw: ImageDraw object for text measurement
+        lines: List of text lines to render
+        size: Font size in pixels
+        font_name: Optional font name from fonts/ folder
+        max_width: Maximum width in pixels
+        line_spacing: Additional spacing between lines in pixels
+
+    Returns:
+        Tuple of (font, total height), where total height is None if any
+        line is wider than max_width
+    """
+    font = None
+    if font_name:
+        font_path = _get_font_path(font_name)
+        if font_path:
+            try:
+                font = _load_truetype(font_path, size)
+            except Exception as e:
+                _LOGGER.debug("Custom font %s failed at size %.1f: %s", font_name, size, e)
+
+    # Use default font if custom font failed or not specified
+    if font is None:
+        font = ImageFont.load_default()
+
+    total_height = 0
+    for line in lines:
+        bbox = draw.textbbox((0, 0), line, font=font)
+
+        # Check if line fits horizontally
+        if bbox[2] - bbox[0] > max_width:
+            return font, None
+
+        total_height += bbox[3] - bbox[1]
+
+    # Add line spacing to total height
+    if len(lines) > 1:
+        total_height += line_spacing * (len(lines) - 1)
+
+    return font, total_height
@@ -2,10 +2,15 @@
 from __future__ import annotations
 
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 
 _LOGGER = logging.getLogger(__name__)
 
+# Font file extensions recognised when resolving font names
+FONT_EXTENSIONS = (".ttf", ".otf", ".woff", ".woff2")
+
 
 def get_font_locations() -> list[Path]:
     """Get list of font directories sorted by priority.
@@ -68,7 +73,7 @@ def get_font_path(font_name: str, locations: list[Path] | None = None) -> Path |
         Path to font file if found, None otherwise
     """
     # Add common font extensions if not present
-    if not any(font_name.lower().endswith(ext) for ext in ['.ttf', '.otf', '.woff', '.woff2']):
+    if not font_name.lower().endswith(FONT_EXTENSIONS):
         font_name += '.ttf'
 
     # Get font locations if not provided
@@ -92,6 +97,11 @@ def get_font_path(font_name: str, locations: list[Path] | None = None) -> Path |
     return None
 
 
+def _log_scan_error(err: OSError) -> None:
+    """Log a directory that could not be scanned for fonts."""
+    _LOGGER.debug("Could not scan directory %s: %s", err.filename, err)
+
+
 def get_available_fonts(locations: list[Path] | None = None) -> list[str]:
     """Get list of available font filenames from all locations.
 
@@ -106,28 +116,13 @@ def get_available_fonts(locations: list[Path] | None = None) -> list[str]:
 
     fonts = set()
 
-    # Scan each location for fonts
+    # Scan each location for fonts, including subdirectories (for system
+    # fonts), in a single string-based pass per location
     for location in locations:
-        try:
-            # Scan for TTF fonts
-            for font_file in location.glob("*.ttf"):
-                fonts.add(font_file.name)
-
-            # Scan for OTF fonts
-            for font_file in location.glob("*.otf"):
-                fonts.add(font_file.name)
-
-            # Also check subdirectories (for system fonts)
-            for font_file in location.rglob("*.ttf"):
-                if font_file.is_file():
-                    fonts.add(font_file.name)
-
-            for font_file in location.rglob("*.otf"):
-                if font_file.is_file():
-                    fonts.add(font_file.name)
-
-        except (OSError, PermissionError) as e:
-            _LOGGER.debug("Could not scan directory %s: %s", location, e)
+        for _dirpath, _dirnames, filenames in os.walk(location, onerror=_log_scan_error):
+            for filename in filenames:
+                if filename.endswith((".ttf", ".otf")):
+                    fonts.add(filename)
 
     # Ensure we have at least a default font
     if not fonts:
@@ -135,3 +130,15 @@ def get_available_fonts(locations: list[Path] | None = None) -> list[str]:
 
     _LOGGER.debug("Found %d unique fonts across all locations", len(fonts))
     return sorted(list(fonts))
+
+
+@lru_cache(maxsize=1)
+def get_cached_fonts() -> tuple[str, ...]:
+    """Get available font filenames, scanning the font locations only once.
+
+    Blocking; run it in the executor.
+
+    Returns:
+        Sorted tuple of unique font filenames
+    """
+    return tuple(get_available_fonts())
@@ -13,11 +13,10 @@ from homeassistant.components.light import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .const import CONF_ADDRESS, CONF_NAME
 from .color import rgb_to_hex
 from .common import get_entity_id_by_unique_id
 
@@ -33,7 +32,7 @@ async def async_setup_entry(
     address = entry.data[CONF_ADDRESS]
     name = entry.data[CONF_NAME]
 
-    api = hass.data[DOMAIN][entry.entry_id]
+    api = entry.runtime_data["api"]
 
     async_add_entities([
         iPIXELTextColorLight(hass, api, entry, address, name),
@@ -74,13 +73,7 @@ class iPIXELColorLight(LightEntity, RestoreEntity):
         self._attr_brightness = 255  # Full brightness by default
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -8,12 +8,11 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
-from .common import get_entity_id_by_unique_id
+from .const import CONF_ADDRESS, CONF_NAME
+from .common import device_slug, get_entity_id_by_unique_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,7 +26,7 @@ async def async_setup_entry(
     address = entry.data[CONF_ADDRESS]
     name = entry.data[CONF_NAME]
     
-    api = hass.data[DOMAIN][entry.entry_id]
+    api = entry.runtime_data["api"]
     
     async_add_entities([
         iPIXELFontSize(api, entry, address, name),
@@ -67,13 +66,7 @@ class iPIXELFontSize(NumberEntity, RestoreEntity):
         self._attr_entity_description = "Font size in pixels (0 = auto-sizing, supports decimals)"
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -140,13 +133,7 @@ class iPIXELLineSpacing(NumberEntity, RestoreEntity):
         self._attr_entity_description = "Extra spacing between lines in pixels (for multiline text)"
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -210,13 +197,7 @@ class iPIXELBrightness(NumberEntity, RestoreEntity):
         self._attr_entity_description = "Display brightness level (1-100)"
         
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -288,17 +269,14 @@ class iPIXELTextAnimation(NumberEntity, RestoreEntity):
         self._entry = entry
         self._address = address
         self._name = name
+        slug = device_slug(name)
+        self._mode_entity_id = f"select.{slug}_mode"
+        self._auto_update_entity_id = f"switch.{slug}_auto_update"
         self._attr_name = "Text Animation"
         self._attr_unique_id = f"{address}_text_animation"
         self._attr_native_value = 0  # Default to no animation
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -328,12 +306,10 @@ class iPIXELTextAnimation(NumberEntity, RestoreEntity):
         try:
             from .common import update_ipixel_display
 
-            mode_entity_id = f"select.{self._name.lower().replace(' ', '_')}_mode"
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+            mode_state = self.hass.states.get(self._mode_entity_id)
 
             if mode_state and mode_state.state == "text":
-                auto_update_entity_id = f"switch.{self._name.lower().replace(' ', '_')}_auto_update"
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
+                auto_update_state = self.hass.states.get(self._auto_update_entity_id)
 
                 if auto_update_state and auto_update_state.state == "on":
                     await update_ipixel_display(self.hass, self._name, self._api)
@@ -369,17 +345,14 @@ class iPIXELTextSpeed(NumberEntity, RestoreEntity):
         self._entry = entry
         self._address = address
         self._name = name
+        slug = device_slug(name)
+        self._mode_entity_id = f"select.{slug}_mode"
+        self._auto_update_entity_id = f"switch.{slug}_auto_update"
         self._attr_name = "Text Speed"
         self._attr_unique_id = f"{address}_text_speed"
         self._attr_native_value = 80  # Default speed
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -409,12 +382,10 @@ class iPIXELTextSpeed(NumberEntity, RestoreEntity):
         try:
             from .common import update_ipixel_display
 
-            mode_entity_id = f"select.{self._name.lower().replace(' ', '_')}_mode"
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+            mode_state = self.hass.states.get(self._mode_entity_id)
 
             if mode_state and mode_state.state == "text":
-                auto_update_entity_id = f"switch.{self._name.lower().replace(' ', '_')}_auto_update"
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
+                auto_update_state = self.hass.states.get(self._auto_update_entity_id)
 
                 if auto_update_state and auto_update_state.state == "on":
                     await update_ipixel_display(self.hass, self._name, self._api)
@@ -450,17 +421,14 @@ class iPIXELTextRainbow(NumberEntity, RestoreEntity):
         self._entry = entry
         self._address = address
         self._name = name
+        slug = device_slug(name)
+        self._mode_entity_id = f"select.{slug}_mode"
+        self._auto_update_entity_id = f"switch.{slug}_auto_update"
         self._attr_name = "Text Rainbow"
         self._attr_unique_id = f"{address}_text_rainbow"
         self._attr_native_value = 0  # Default to no rainbow
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -490,12 +458,10 @@ class iPIXELTextRainbow(NumberEntity, RestoreEntity):
         try:
             from .common import update_ipixel_display
 
-            mode_entity_id = f"select.{self._name.lower().replace(' ', '_')}_mode"
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
+            mode_state = self.hass.states.get(self._mode_entity_id)
 
             if mode_state and mode_state.state == "text":
-                auto_update_entity_id = f"switch.{self._name.lower().replace(' ', '_')}_auto_update"
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
+                auto_update_state = self.hass.states.get(self._auto_update_entity_id)
 
                 if auto_update_state and auto_update_state.state == "on":
                     await update_ipixel_display(self.hass, self._name, self._api)
@@ -1,23 +1,19 @@
-"""Select entity for iPIXEL Color font selection."""
+"""Select entities for iPIXEL Color font, mode and clock style selection."""
 from __future__ import annotations
 
 import logging
-import os
-from pathlib import Path
-from typing import Any
+from dataclasses import dataclass
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .api import iPIXELAPI
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME, AVAILABLE_MODES, DEFAULT_MODE
+from .const import CONF_ADDRESS, AVAILABLE_MODES, CLOCK_STYLES, DEFAULT_MODE, MODE_CLOCK
 from .common import get_entity_id_by_unique_id
-from .common import update_ipixel_display
-from .fonts import get_available_fonts
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,257 +25,180 @@ async def async_setup_entry(
 ) -> None:
     """Set up the iPIXEL Color select entities."""
     address = entry.data[CONF_ADDRESS]
-    name = entry.data[CONF_NAME]
     
-    api = hass.data[DOMAIN][entry.entry_id]
-    
-    async_add_entities([
-        iPIXELFontSelect(hass, api, entry, address, name),
-        iPIXELModeSelect(hass, api, entry, address, name),
-        iPIXELClockStyleSelect(hass, api, entry, address, name),
-    ])
-
-
-class iPIXELFontSelect(SelectEntity, RestoreEntity):
-    """Representation of an iPIXEL Color font selection."""
-
-    def __init__(
-        self, 
-        hass: HomeAssistant,
-        api: iPIXELAPI, 
-        entry: ConfigEntry, 
-        address: str, 
-        name: str
-    ) -> None:
-        """Initialize the font select."""
-        self.hass = hass
-        self._api = api
-        self._entry = entry
-        self._address = address
-        self._name = name
-        self._attr_name = "Font"
-        self._attr_unique_id = f"{address}_font_select"
-        self._attr_entity_description = "Select font for text display"
-
-        # Get available fonts from all locations
-        self._attr_options = get_available_fonts()
-        self._attr_current_option = "OpenSans-Light.ttf" if "OpenSans-Light.ttf" in self._attr_options else self._attr_options[0]
-        
-        # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
-
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-        
-        # Restore last state if available
-        last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state in self._attr_options:
-            self._attr_current_option = last_state.state
-            _LOGGER.debug("Restored font selection: %s", self._attr_current_option)
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected font."""
-        return self._attr_current_option
-
-    async def async_select_option(self, option: str) -> None:
-        """Select a font option."""
-        if option in self._attr_options:
-            self._attr_current_option = option
-            _LOGGER.debug("Font changed to: %s", option)
-            
-            # Trigger display update if auto-update is enabled
-            await self._trigger_auto_update()
-        else:
-            _LOGGER.error("Invalid font option: %s", option)
+    fonts = entry.runtime_data["fonts"]
+
+    specs = (
+        SelectSpec(
+            key="font_select",
+            name="Font",
+            description="Select font for text display",
+            setting="font",
+            # Available fonts from all locations, scanned once in setup
+            options=fonts,
+            default="OpenSans-Light.ttf" if "OpenSans-Light.ttf" in fonts else fonts[0],
+        ),
+        SelectSpec(
+            key="mode_select",
+            name="Mode",
+            description="Select display mode (textimage, clock, rhythm, fun)",
+            setting="mode",
+            options=tuple(AVAILABLE_MODES),
+            default=DEFAULT_MODE,
+        ),
+        SelectSpec(
+            key="clock_style_select",
+            name="Clock Style",
+            description="Select clock display style (0-8)",
+            setting="clock style",
+            options=CLOCK_STYLES,
+            default="1",
+            require_clock_mode=True,
+        ),
+    )
+
+    async_add_entities(
+        iPIXELSelect(hass, entry, address, spec) for spec in specs
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SelectSpec:
+    """Static description of one iPIXEL select entity."""
+
+    key: str
+    name: str
+    description: str
+    setting: str
+    options: tuple[str, ...]
+    default: str
+    require_clock_mode: bool = False
+
+
+async def _maybe_auto_update(
+    hass: HomeAssistant,
+    debouncer: Debouncer,
+    address: str,
+    changed: str,
+    auto_update_on: bool | None,
+    *,
+    require_clock_mode: bool = False,
+) -> None:
+    """Refresh the display after a select change if auto-update is enabled.
+
+    Args:
+        hass: Home Assistant instance
+        debouncer: Per-device debouncer that runs the display update
+        address: Device address for entity registry lookups
+        changed: Name of the changed setting, for logging
+        auto_update_on: Tracked auto-update state, or None to look it up
+        require_clock_mode: Only refresh while the display is in clock mode
+    """
+    try:
+        if require_clock_mode:
+            # Check if we're in clock mode
+            mode_entity_id = get_entity_id_by_unique_id(hass, address, "mode_select", "select")
+            mode_state = hass.states.get(mode_entity_id) if mode_entity_id else None
+            if not mode_state or mode_state.state != MODE_CLOCK:
+                return
 
-    async def _trigger_auto_update(self) -> None:
-        """Trigger display update if auto-update is enabled."""
-        try:
-            # Check auto-update setting
-            auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-            auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-            
-            if auto_update_state and auto_update_state.state == "on":
-                # Use common update function directly
-                await update_ipixel_display(self.hass, self._name, self._api)
-                _LOGGER.debug("Auto-update triggered display refresh due to font change")
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+        # Check auto-update setting, unless it is already tracked
+        if auto_update_on is None:
+            auto_update_entity_id = get_entity_id_by_unique_id(hass, address, "auto_update", "switch")
+            auto_update_state = hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
+            auto_update_on = auto_update_state is not None and auto_update_state.state == "on"
 
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
+        if auto_update_on:
+            # Rapid changes to several settings result in a single refresh
+            await debouncer.async_call()
+            _LOGGER.debug("Auto-update scheduled display refresh due to %s change", changed)
+    except Exception as err:
+        _LOGGER.debug("Could not trigger auto-update: %s", err)
 
 
-class iPIXELModeSelect(SelectEntity, RestoreEntity):
-    """Representation of an iPIXEL Color mode selection."""
+class iPIXELSelect(SelectEntity, RestoreEntity):
+    """Representation of an iPIXEL Color selection."""
 
     def __init__(
         self,
         hass: HomeAssistant,
-        api: iPIXELAPI,
         entry: ConfigEntry,
         address: str,
-        name: str
+        spec: SelectSpec,
     ) -> None:
-        """Initialize the mode select."""
+        """Initialize the select."""
         self.hass = hass
-        self._api = api
-        self._entry = entry
         self._address = address
-        self._name = name
-        self._attr_name = "Mode"
-        self._attr_unique_id = f"{address}_mode_select"
-        self._attr_entity_description = "Select display mode (textimage, clock, rhythm, fun)"
+        self._spec = spec
+        self._auto_update = entry.runtime_data["auto_update"]
+        self._attr_name = spec.name
+        self._attr_unique_id = f"{address}_{spec.key}"
+        self._attr_entity_description = spec.description
 
-        # Set available mode options
-        self._attr_options = AVAILABLE_MODES
-        self._attr_current_option = DEFAULT_MODE
+        self._attr_options = spec.options
+        self._attr_current_option = spec.default
+        self._options_set = frozenset(spec.options)
+        self._auto_update_on: bool | None = None
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
+        self._async_track_auto_update()
 
         # Restore last state if available
         last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state in self._attr_options:
+        if last_state is not None and last_state.state in self._options_set:
             self._attr_current_option = last_state.state
-            _LOGGER.debug("Restored mode selection: %s", self._attr_current_option)
-
-    @property
-    def current_option(self) -> str | None:
-        """Return the current selected mode."""
-        return self._attr_current_option
-
-    async def async_select_option(self, option: str) -> None:
-        """Select a mode option."""
-        if option in self._attr_options:
-            self._attr_current_option = option
-            _LOGGER.info("Mode changed to: %s", option)
-
-            # Trigger display update if auto-update is enabled
-            await self._trigger_auto_update()
-        else:
-            _LOGGER.error("Invalid mode option: %s", option)
-
-    async def _trigger_auto_update(self) -> None:
-        """Trigger display update if auto-update is enabled."""
-        try:
-            # Check auto-update setting
-            auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-            auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-
-            if auto_update_state and auto_update_state.state == "on":
-                # Use common update function directly
-                await update_ipixel_display(self.hass, self._name, self._api)
-                _LOGGER.debug("Auto-update triggered display refresh due to mode change")
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return True
-
-
-class iPIXELClockStyleSelect(SelectEntity, RestoreEntity):
-    """Representation of an iPIXEL Color clock style selection."""
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        api: iPIXELAPI,
-        entry: ConfigEntry,
-        address: str,
-        name: str
-    ) -> None:
-        """Initialize the clock style select."""
-        self.hass = hass
-        self._api = api
-        self._entry = entry
-        self._address = address
-        self._name = name
-        self._attr_name = "Clock Style"
-        self._attr_unique_id = f"{address}_clock_style_select"
-        self._attr_entity_description = "Select clock display style (0-8)"
-
-        # Clock styles 0-8
-        self._attr_options = ["0", "1", "2", "3", "4", "5", "6", "7", "8"]
-        self._attr_current_option = "1"  # Default style
-
-        # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
+            _LOGGER.debug("Restored %s selection: %s", self._spec.setting, self._attr_current_option)
+
+    @callback
+    def _async_track_auto_update(self) -> None:
+        """Keep _auto_update_on in sync with the auto-update switch.
+
+        Leaves it None if the switch is not registered yet, so the state is
+        looked up on demand instead.
+        """
+        auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
+        if auto_update_entity_id is None:
+            return
+
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [auto_update_entity_id], self._async_auto_update_changed
+            )
         )
+        auto_update_state = self.hass.states.get(auto_update_entity_id)
+        self._auto_update_on = auto_update_state is not None and auto_update_state.state == "on"
 
-    async def async_added_to_hass(self) -> None:
-        """Run when entity about to be added to hass."""
-        await super().async_added_to_hass()
-
-        # Restore last state if available
-        last_state = await self.async_get_last_state()
-        if last_state is not None and last_state.state in self._attr_options:
-            self._attr_current_option = last_state.state
-            _LOGGER.debug("Restored clock style selection: %s", self._attr_current_option)
+    @callback
+    def _async_auto_update_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Cache the new state of the auto-update switch."""
+        new_state = event.data["new_state"]
+        self._auto_update_on = new_state is not None and new_state.state == "on"
 
     @property
     def current_option(self) -> str | None:
-        """Return the current selected clock style."""
+        """Return the current selected option."""
         return self._attr_current_option
 
     async def async_select_option(self, option: str) -> None:
-        """Select a clock style option."""
-        if option in self._attr_options:
+        """Select an option."""
+        if option in self._options_set:
             self._attr_current_option = option
-            _LOGGER.info("Clock style changed to: %s", option)
+            _LOGGER.info("%s changed to: %s", self._spec.name, option)
 
-            # Trigger display update if auto-update is enabled and in clock mode
-            await self._trigger_auto_update()
+            # Trigger display update if auto-update is enabled
+            await _maybe_auto_update(
+                self.hass, self._auto_update, self._address, self._spec.setting, self._auto_update_on,
+                require_clock_mode=self._spec.require_clock_mode,
+            )
         else:
-            _LOGGER.error("Invalid clock style option: %s", option)
-
-    async def _trigger_auto_update(self) -> None:
-        """Trigger display update if auto-update is enabled and in clock mode."""
-        try:
-            # Check if we're in clock mode
-            mode_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "mode_select", "select")
-            mode_state = self.hass.states.get(mode_entity_id) if mode_entity_id else None
-
-            if mode_state and mode_state.state == "clock":
-                # Check auto-update setting
-                auto_update_entity_id = get_entity_id_by_unique_id(self.hass, self._address, "auto_update", "switch")
-                auto_update_state = self.hass.states.get(auto_update_entity_id) if auto_update_entity_id else None
-
-                if auto_update_state and auto_update_state.state == "on":
-                    # Use common update function directly
-                    await update_ipixel_display(self.hass, self._name, self._api)
-                    _LOGGER.debug("Auto-update triggered display refresh due to clock style change")
-        except Exception as err:
-            _LOGGER.debug("Could not trigger auto-update: %s", err)
+            _LOGGER.error("Invalid %s option: %s", self._spec.setting, option)
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return True
\ No newline at end of file
+        return True
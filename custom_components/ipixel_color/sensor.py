@@ -12,10 +12,10 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 
 from .api import iPIXELAPI, iPIXELConnectionError
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .const import CONF_ADDRESS, CONF_NAME
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -64,7 +64,7 @@ async def async_setup_entry(
     address = entry.data[CONF_ADDRESS]
     name = entry.data[CONF_NAME]
     
-    api = hass.data[DOMAIN][entry.entry_id]
+    api = entry.runtime_data["api"]
     
     # Create sensor entities
     sensors = []
@@ -98,13 +98,7 @@ class iPIXELSensor(SensorEntity):
         self._available = True
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     @property
     def available(self) -> bool:
@@ -117,7 +111,8 @@ class iPIXELSensor(SensorEntity):
             if not self._api.is_connected:
                 self._available = False
                 return
-                
+
+            # Joins the query started during setup if it is still in flight
             device_info = await self._api.get_device_info()
             if device_info:
                 self._attr_native_value = device_info.get(self.entity_description.key)
@@ -8,11 +8,10 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI, iPIXELConnectionError
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .const import CONF_ADDRESS, CONF_NAME
 from .common import get_entity_id_by_unique_id
 from .common import update_ipixel_display
 
@@ -28,7 +27,7 @@ async def async_setup_entry(
     address = entry.data[CONF_ADDRESS]
     name = entry.data[CONF_NAME]
     
-    api = hass.data[DOMAIN][entry.entry_id]
+    api = entry.runtime_data["api"]
     
     async_add_entities([
         iPIXELSwitch(api, entry, address, name),
@@ -60,13 +59,7 @@ class iPIXELSwitch(SwitchEntity):
         self._available = True
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     @property
     def is_on(self) -> bool:
@@ -83,9 +76,7 @@ class iPIXELSwitch(SwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
         try:
-            if not self._api.is_connected:
-                _LOGGER.debug("Reconnecting to device before turning on")
-                await self._api.connect()
+            await self._api.ensure_connected()
             
             success = await self._api.set_power(True)
             if success:
@@ -103,9 +94,7 @@ class iPIXELSwitch(SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
         try:
-            if not self._api.is_connected:
-                _LOGGER.debug("Reconnecting to device before turning off")
-                await self._api.connect()
+            await self._api.ensure_connected()
             
             success = await self._api.set_power(False)
             if success:
@@ -160,13 +149,7 @@ class iPIXELAntialiasingSwitch(SwitchEntity, RestoreEntity):
         self._is_on = True  # Default to antialiasing enabled
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -222,13 +205,7 @@ class iPIXELAutoUpdateSwitch(SwitchEntity, RestoreEntity):
         self._is_on = False  # Default to manual updates only
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -286,13 +263,7 @@ class iPIXELClock24HSwitch(SwitchEntity, RestoreEntity):
         self._is_on = True  # Default to 24h format
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -370,13 +341,7 @@ class iPIXELClockShowDateSwitch(SwitchEntity, RestoreEntity):
         self._is_on = True  # Default to showing date
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -8,13 +8,12 @@ from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .api import iPIXELAPI, iPIXELConnectionError
-from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .const import CONF_ADDRESS, CONF_NAME
 from .common import get_entity_id_by_unique_id
-from .common import resolve_template_variables, update_ipixel_display
+from .common import process_escape_sequences, resolve_template_variables, update_ipixel_display
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,7 +27,7 @@ async def async_setup_entry(
     address = entry.data[CONF_ADDRESS]
     name = entry.data[CONF_NAME]
     
-    api = hass.data[DOMAIN][entry.entry_id]
+    api = entry.runtime_data["api"]
     
     async_add_entities([
         iPIXELTextDisplay(hass, api, entry, address, name),
@@ -39,6 +38,7 @@ class iPIXELTextDisplay(TextEntity, RestoreEntity):
     """Representation of an iPIXEL Color text display."""
 
     _attr_mode = TextMode.TEXT
+    _attr_should_poll = False  # State only changes when the text is set
     _attr_native_max = 500  # Maximum 500 characters per protocol
 
     def __init__(
@@ -52,28 +52,14 @@ class iPIXELTextDisplay(TextEntity, RestoreEntity):
         """Initialize the text display."""
         self.hass = hass
         self._api = api
-        self._entry = entry
         self._address = address
         self._name = name
         self._attr_name = "Display"
         self._attr_unique_id = f"{address}_text_display"
         self._current_text = ""
-        self._available = True
-        
-        # Store current settings (could be exposed as additional entities later)
-        self._effect = "scroll_ltr"  # Default to left-to-right scrolling
-        self._speed = 50
-        self._color_fg = (255, 255, 255)  # White text
-        self._color_bg = (0, 0, 0)  # Black background
 
         # Device info for grouping in device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            name=name,
-            manufacturer="iPIXEL",
-            model="LED Matrix Display",
-            sw_version="1.0",
-        )
+        self._attr_device_info = entry.runtime_data["device_info"]
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
@@ -111,7 +97,7 @@ class iPIXELTextDisplay(TextEntity, RestoreEntity):
             
             # Resolve templates and process escape sequences when sending to display
             template_resolved = await resolve_template_variables(self.hass, value)
-            processed_text = template_resolved.replace('\\n', '\n').replace('\\t', '\t')
+            processed_text = process_escape_sequences(template_resolved)
             
             # Auto-update is enabled, proceed with display update
             await self._update_display(processed_text)
@@ -143,18 +129,4 @@ class iPIXELTextDisplay(TextEntity, RestoreEntity):
             _LOGGER.debug("Could not get auto-update setting: %s", err)
         return False  # Default to manual updates only
 
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        try:
-            # Check connection status
-            if self._api.is_connected:
-                self._available = True
-            else:
-                self._available = False
-                _LOGGER.debug("Device not connected, marking as unavailable")
-                
-        except Exception as err:
-            _LOGGER.error("Error updating entity state: %s", err)
-            self._available = False
-
 